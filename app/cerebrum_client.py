@@ -6,11 +6,67 @@ which manages CLIPS expert system sessions and evaluations.
 import aiohttp
 import logging
 from typing import Optional, Dict, Any
-import json
+
+import orjson
+
+# Optional accelerator: pysimdjson parses lazily, so pulling one field out of
+# a large eval response doesn't materialize the whole document.
+try:
+    import simdjson
+    _simd_parser = simdjson.Parser()
+except ImportError:
+    _simd_parser = None
 
 logger = logging.getLogger(__name__)
 
 
+def _parse_eval_response(raw: bytes) -> Dict[str, Any]:
+    """Decode an eval response body.
+
+    Callers only consume the "stdout" field, which for rule-heavy runs can be
+    a small slice of a large payload. With simdjson available only that field
+    is materialized; otherwise the full document is decoded with orjson.
+    """
+    if _simd_parser is not None:
+        try:
+            doc = _simd_parser.parse(raw)
+            try:
+                stdout = str(doc["stdout"])
+            except KeyError:
+                stdout = ""
+            return {"stdout": stdout}
+        except ValueError:
+            pass  # malformed for simdjson; let orjson raise a clearer error
+    return orjson.loads(raw)
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_TEXT_HEADERS = {"Content-Type": "text/plain"}
+
+# Scripts above this size are sent as raw text/plain; JSON-wrapping large
+# CLIPS source escapes every quote and newline for no benefit.
+_TEXT_EVAL_THRESHOLD = 1024
+
+# Hoisted timeouts so hot-path calls don't rebuild ClientTimeout objects.
+_DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=30)
+_STATUS_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+
+def _make_client_session() -> aiohttp.ClientSession:
+    """Build a ClientSession with a pooled, keep-alive connector.
+
+    Connection reuse avoids a TCP (and TLS) handshake per Cerebrum call;
+    the DNS cache avoids re-resolving the base URL on every request.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=100,
+        limit_per_host=20,
+        keepalive_timeout=30,
+        ttl_dns_cache=300,
+        enable_cleanup_closed=True,
+    )
+    return aiohttp.ClientSession(connector=connector, timeout=_DEFAULT_TIMEOUT)
+
+
 class ClaraSession:
     """Represents a persistent CLIPS session."""
 
@@ -32,16 +88,31 @@ class ClaraSession:
 
 
 class CerebrumClient:
-    """Async client for Clara Cerebrum REST API."""
+    """Async client for Clara Cerebrum REST API.
+
+    The aiohttp session is opened eagerly by `connect()` (or the async
+    context manager) rather than lazily per call, so request methods carry
+    no session-existence branch and two coroutines can never race to create
+    duplicate sessions.
+    """
 
     def __init__(self, base_url: str = "http://localhost:8080"):
         self.base_url = base_url.rstrip('/')
         self.session: Optional[aiohttp.ClientSession] = None
         self._current_session: Optional[ClaraSession] = None
+        # orjson serializes/deserializes several times faster than stdlib json;
+        # pre-bind so hot-path calls avoid a module attribute lookup.
+        self._dumps = orjson.dumps
+        # Cleared the first time the server rejects the text/plain eval route
+        self._text_eval_supported = True
+
+    async def connect(self):
+        """Open the pooled aiohttp session. Must be called before requests."""
+        self.session = _make_client_session()
 
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession()
+        await self.connect()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -49,25 +120,17 @@ class CerebrumClient:
         if self.session:
             await self.session.close()
 
-    async def _ensure_session(self):
-        """Ensure aiohttp session exists."""
-        if not self.session:
-            self.session = aiohttp.ClientSession()
-
     async def health_check(self) -> bool:
         """Check if Clara API is healthy."""
         try:
-            await self._ensure_session()
             async with self.session.get(f"{self.base_url}/healthz") as resp:
                 return resp.status == 200
         except Exception as e:
-            logger.error(f"Health check failed: {e}")
+            logger.error("Health check failed: %s", e)
             return False
 
     async def create_session(self, user_id: str = "default") -> ClaraSession:
         """Create a new persistent CLIPS session."""
-        await self._ensure_session()
-
         payload = {
             "user_id": user_id,
             "preload": [],
@@ -77,98 +140,122 @@ class CerebrumClient:
         try:
             async with self.session.post(
                 f"{self.base_url}/sessions",
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=30)
+                data=self._dumps(payload),
+                headers=_JSON_HEADERS,
+                timeout=_DEFAULT_TIMEOUT
             ) as resp:
                 if resp.status == 201 or resp.status == 200:
-                    data = await resp.json()
+                    data = orjson.loads(await resp.read())
                     session_id = data.get("session_id") or data.get("id")
-                    logger.info(f"Created session: {session_id}")
+                    logger.info("Created session: %s", session_id)
                     self._current_session = ClaraSession(session_id, self)
                     return self._current_session
                 else:
                     error_text = await resp.text()
                     raise RuntimeError(f"Failed to create session: {resp.status} {error_text}")
         except Exception as e:
-            logger.error(f"Error creating session: {e}")
+            logger.error("Error creating session: %s", e)
             raise
 
     async def get_session(self, session_id: str) -> Dict[str, Any]:
         """Get session information."""
-        await self._ensure_session()
-
         try:
             async with self.session.get(
                 f"{self.base_url}/sessions/{session_id}",
-                timeout=aiohttp.ClientTimeout(total=10)
+                timeout=_STATUS_TIMEOUT
             ) as resp:
                 if resp.status == 200:
-                    return await resp.json()
+                    return orjson.loads(await resp.read())
                 else:
                     error_text = await resp.text()
                     raise RuntimeError(f"Failed to get session: {resp.status} {error_text}")
         except Exception as e:
-            logger.error(f"Error getting session: {e}")
+            logger.error("Error getting session: %s", e)
             raise
 
+    async def _eval_session_text(self, session_id: str, script: str) -> Optional[Dict[str, Any]]:
+        """Evaluate a script via the raw text/plain endpoint.
+
+        Returns None (and stops trying) when the server doesn't expose the
+        endpoint, so callers fall back to the JSON route.
+        """
+        async with self.session.post(
+            f"{self.base_url}/sessions/{session_id}/eval-text",
+            data=script.encode(),
+            headers=_TEXT_HEADERS,
+            timeout=_DEFAULT_TIMEOUT
+        ) as resp:
+            if resp.status == 200:
+                return _parse_eval_response(await resp.read())
+            if resp.status in (404, 405):
+                self._text_eval_supported = False
+                return None
+            error_text = await resp.text()
+            raise RuntimeError(f"Eval failed: {resp.status} {error_text}")
+
     async def eval_session(self, session_id: str, script: str) -> Dict[str, Any]:
         """Evaluate CLIPS script in a session."""
-        await self._ensure_session()
+        if self._text_eval_supported and len(script) > _TEXT_EVAL_THRESHOLD:
+            try:
+                result = await self._eval_session_text(session_id, script)
+                if result is not None:
+                    return result
+            except aiohttp.ClientError as e:
+                logger.error("Error evaluating script: %s", e)
+                raise
 
         payload = {"script": script}
 
         try:
             async with self.session.post(
                 f"{self.base_url}/sessions/{session_id}/eval",
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=30)
+                data=self._dumps(payload),
+                headers=_JSON_HEADERS,
+                timeout=_DEFAULT_TIMEOUT
             ) as resp:
                 if resp.status == 200:
-                    return await resp.json()
+                    return _parse_eval_response(await resp.read())
                 else:
                     error_text = await resp.text()
                     raise RuntimeError(f"Eval failed: {resp.status} {error_text}")
         except Exception as e:
-            logger.error(f"Error evaluating script: {e}")
+            logger.error("Error evaluating script: %s", e)
             raise
 
     async def save_session(self, session_id: str) -> Dict[str, Any]:
         """Save session state."""
-        await self._ensure_session()
-
         try:
             async with self.session.post(
                 f"{self.base_url}/sessions/{session_id}/save",
-                timeout=aiohttp.ClientTimeout(total=30)
+                timeout=_DEFAULT_TIMEOUT
             ) as resp:
                 if resp.status == 200:
-                    return await resp.json()
+                    return orjson.loads(await resp.read())
                 else:
                     error_text = await resp.text()
                     raise RuntimeError(f"Save failed: {resp.status} {error_text}")
         except Exception as e:
-            logger.error(f"Error saving session: {e}")
+            logger.error("Error saving session: %s", e)
             raise
 
     async def eval_ephemeral(self, script: str) -> Dict[str, Any]:
         """Evaluate CLIPS script in an ephemeral session."""
-        await self._ensure_session()
-
         payload = {"script": script}
 
         try:
             async with self.session.post(
                 f"{self.base_url}/eval",
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=30)
+                data=self._dumps(payload),
+                headers=_JSON_HEADERS,
+                timeout=_DEFAULT_TIMEOUT
             ) as resp:
                 if resp.status == 200:
-                    return await resp.json()
+                    return _parse_eval_response(await resp.read())
                 else:
                     error_text = await resp.text()
                     raise RuntimeError(f"Ephemeral eval failed: {resp.status} {error_text}")
         except Exception as e:
-            logger.error(f"Error in ephemeral eval: {e}")
+            logger.error("Error in ephemeral eval: %s", e)
             raise
 
     async def close(self):
@@ -7,25 +7,37 @@ from typing import Optional
 
 class Config:
     """Clara server configuration."""
-    
-    def __init__(self):
+
+    __slots__ = (
+        "host",
+        "port",
+        "audio_cache_ttl_seconds",
+        "audio_cache_cleanup_interval_seconds",
+        "bearer_token",
+    )
+
+    def __init__(self, config_path: Optional[str] = None):
         # Server settings
         self.host: str = "0.0.0.0"
         self.port: int = 8000
-        
+
         # Audio cache settings
         self.audio_cache_ttl_seconds: int = 3600  # 1 hour default
         self.audio_cache_cleanup_interval_seconds: int = 300  # Check every 5 minutes
-        
+
         # Authentication
         self.bearer_token: str = "mysecrettoken"
-        
+
         # Load from config file if exists
-        self._load_from_file()
-    
-    def _load_from_file(self):
-        """Load configuration from clara_config.json if it exists."""
-        config_path = Path("clara_config.json")
+        self._load_from_file(config_path)
+
+    def _load_from_file(self, config_path: Optional[str] = None):
+        """Load configuration from config_path (default clara_config.json in cwd).
+
+        An explicit path lets callers (and tests) point at a file directly
+        instead of relying on process-global working-directory discovery.
+        """
+        config_path = Path(config_path) if config_path else Path("clara_config.json")
         if config_path.exists():
             try:
                 with open(config_path) as f:
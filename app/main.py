@@ -1,12 +1,16 @@
 from audioread import audio_open
-from fastapi import FastAPI, Depends, HTTPException, WebSocket
+from fastapi import FastAPI, Depends, HTTPException, Request, Response, WebSocket
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse
 from pydantic import BaseModel
 from pathlib import Path
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 import asyncio
+import hashlib
+import hmac
 import logging
+import mmap
 import os
 import time
 from typing import Optional, List, Dict, Any
@@ -15,14 +19,50 @@ from app.tts import ChatterboxTTS
 from app.cerebrum_client import CerebrumClient
 from app.config import config
 
+# Use uvloop's libuv-based event loop when available; it has noticeably lower
+# per-callback overhead than the stdlib loop under concurrent WebSocket + HTTP load.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown events."""
+    global _cerebrum_client
+
     # Startup
-    logger.info(f"Starting Clara server on {config.host}:{config.port}")
-    logger.info(f"Audio cache TTL: {config.audio_cache_ttl_seconds}s")
-    logger.info(f"Audio cache cleanup interval: {config.audio_cache_cleanup_interval_seconds}s")
+    logger.info("Starting Clara server on %s:%s", config.host, config.port)
+    logger.info("Audio cache TTL: %ss", config.audio_cache_ttl_seconds)
+    logger.info("Audio cache cleanup interval: %ss", config.audio_cache_cleanup_interval_seconds)
+
+    # Create the Cerebrum client (and its pooled aiohttp session) up front so
+    # requests never pay connection-pool construction cost.
+    _cerebrum_client = CerebrumClient(base_url=os.getenv("CEREBRUM_API_URL", "http://localhost:8080"))
+    await _cerebrum_client.connect()
+
+    # Warm the CLIPS session so the first /prompt after a restart doesn't pay
+    # the create_session round-trip; tolerate Cerebrum being down at boot.
+    try:
+        await _get_cerebrum_session()
+    except Exception as e:
+        logger.warning("Cerebrum session warm-up failed (will retry on first /prompt): %s", e)
+
+    # Optionally load the TTS model during startup rather than on the first
+    # /speak. Off by default so dev servers and CI boot fast; with multiple
+    # workers, pair CLARA_TTS_PRELOAD=1 with a preloading process manager
+    # (gunicorn --preload) so the CPU weights are forked copy-on-write
+    # instead of loaded once per worker.
+    if os.getenv("CLARA_TTS_PRELOAD", "0") == "1":
+        try:
+            await asyncio.to_thread(ChatterboxTTS.preload)
+            logger.info("TTS model preloaded")
+        except Exception as e:
+            logger.warning("TTS preload failed (will retry lazily on /speak): %s", e)
+
+    keepalive_task = asyncio.create_task(_cerebrum_keepalive())
 
     cleanup_task = None
     if config.audio_cache_ttl_seconds > 0:
@@ -34,27 +74,132 @@ async def lifespan(app: FastAPI):
     yield
 
     # Shutdown
-    if cleanup_task:
-        cleanup_task.cancel()
-        try:
-            await cleanup_task
-        except asyncio.CancelledError:
-            pass
+    for task in (cleanup_task, keepalive_task):
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+    if _cerebrum_client:
+        await _cerebrum_client.close()
+        _cerebrum_client = None
     logger.info("Clara server shutting down")
 
 
-app = FastAPI(title="Clara API", version="0.1.0", lifespan=lifespan)
+app = FastAPI(title="Clara API", version="0.1.0", lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # Audio cache directory
 audio_cache_dir = Path("audio")
 audio_cache_dir.mkdir(exist_ok=True)
 
+def _cache_path(text_hash: str) -> Path:
+    """Two-level sharded path for a cached WAV (audio/ab/cd/<hash>.wav).
+
+    Keeps any one directory bounded to 256 entries' worth of fan-out so
+    lookups and sweeps stay fast once the cache grows past ~10^5 files.
+    """
+    return audio_cache_dir / text_hash[:2] / text_hash[2:4] / f"{text_hash}.wav"
+
+
+# Bounded LRU of known cache entries (text hash -> WAV path) so cache hits are
+# a dict lookup instead of a stat syscall per request.
+_audio_cache: "OrderedDict[str, Path]" = OrderedDict()
+_AUDIO_CACHE_MAX_ENTRIES = 10000
+
+
+# Synthesis parameters and model identity folded into every cache key, so
+# changing voice settings or upgrading the model busts stale audio instead of
+# serving it.
+_TTS_CACHE_SALT = b"|model=chatterbox|cfg=0.8|ex=0.0"
+
+
+def _text_hash(text: str) -> str:
+    """Stable content hash for cache filenames.
+
+    blake2b is fast on short inputs and, unlike the builtin hash(), is not
+    salted per process — so the on-disk cache survives restarts and is shared
+    across workers.
+    """
+    h = hashlib.blake2b(text.encode("utf-8"), digest_size=16)
+    h.update(_TTS_CACHE_SALT)
+    return h.hexdigest()
+
+
+def _remember_audio(text_hash: str, path: Path):
+    """Record a cache entry, evicting the least recently used when full."""
+    _audio_cache[text_hash] = path
+    _audio_cache.move_to_end(text_hash)
+    if len(_audio_cache) > _AUDIO_CACHE_MAX_ENTRIES:
+        _audio_cache.popitem(last=False)
+
+
+# In-flight synthesis futures so duplicate concurrent requests coalesce onto
+# one synthesis job instead of each spawning their own
+_inflight: Dict[str, asyncio.Future] = {}
+
+
+def _tts_fallback_response() -> FileResponse:
+    """Serve the canned fallback clip when synthesis fails."""
+    fallback_file = Path("./app/assets/masters_of_the_earth.wav")
+    if fallback_file.exists():
+        logger.info("Using fallback audio: masters_of_the_earth.wav")
+        return FileResponse(fallback_file, media_type="audio/wav")
+    logger.error("Fallback file not found: %s", fallback_file)
+    raise HTTPException(status_code=500, detail="TTS synthesis failed and fallback audio not available")
+
+# mmap-backed cache of hot audio files so repeated /audio/{guid} requests for
+# the same clip don't reopen and re-read the WAV from disk every time. Bounded
+# by total mapped bytes rather than entry count, so a run of large clips can't
+# blow past the intended RAM budget.
+_mmap_cache: "OrderedDict[str, mmap.mmap]" = OrderedDict()
+_MMAP_CACHE_MAX_BYTES = 128 * 1024 * 1024
+_mmap_cache_bytes = 0
+
+
+def _get_hot_audio(guid: str, path: Path) -> mmap.mmap:
+    """Return an mmap over the cached WAV, keeping hot entries resident."""
+    global _mmap_cache_bytes
+    mm = _mmap_cache.get(guid)
+    if mm is not None and not mm.closed:
+        _mmap_cache.move_to_end(guid)
+        return mm
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    _mmap_cache[guid] = mm
+    _mmap_cache_bytes += len(mm)
+    while _mmap_cache_bytes > _MMAP_CACHE_MAX_BYTES and len(_mmap_cache) > 1:
+        _, evicted = _mmap_cache.popitem(last=False)
+        _mmap_cache_bytes -= len(evicted)
+        evicted.close()
+    return mm
+
+
+def _drop_hot_audio(guid: str):
+    """Invalidate an mmap cache entry (called when the file is unlinked)."""
+    global _mmap_cache_bytes
+    mm = _mmap_cache.pop(guid, None)
+    if mm is not None:
+        _mmap_cache_bytes -= len(mm)
+        mm.close()
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Bearer token authentication
+# Bearer token authentication. The token is encoded once at import so the
+# hot path avoids repeated attribute resolution, and compared with
+# hmac.compare_digest so the check is constant-time. The comparison runs
+# on bytes: compare_digest raises TypeError on non-ASCII str input, which
+# would turn a garbage token into a 500 instead of a 403.
 bearer_scheme = HTTPBearer()
+_BEARER_TOKEN = config.bearer_token.encode()
+
+
+async def require_bearer(auth: HTTPAuthorizationCredentials = Depends(bearer_scheme)) -> None:
+    """Reject the request unless it carries the configured bearer token."""
+    if not hmac.compare_digest(auth.credentials.encode(), _BEARER_TOKEN):
+        raise HTTPException(status_code=403, detail="Invalid or expired token")
 
 
 # Initialize TTS with the voice sample for cloning (optional)
@@ -79,13 +224,18 @@ class PromptResponse(BaseModel):
     reasoning: Optional[Dict[str, Any]] = None
     clips_output: Optional[str] = None
 
-# List to hold connected WebSocket clients
-connected_clients: List[WebSocket] = []
+# Connected WebSocket clients; a set gives O(1) add/remove under churn
+connected_clients: set[WebSocket] = set()
 
 # Global CLIPS session for logic-informed responses
 _cerebrum_client: Optional[CerebrumClient] = None
 _cerebrum_session = None
 
+# Rule blocks already defined in a CLIPS session ("session_id:rules_hash").
+# Sessions are persistent, so re-sending the same defrules on every /prompt
+# just wastes request bytes and Cerebrum parse time.
+_session_rules_seen: set = set()
+
 @app.get("/health")
 async def health():
     """
@@ -94,58 +244,70 @@ async def health():
     """
     return {"status": "ok"}
 
-def _file_streamer(path: str, remove_after: bool = False):
-    """Return a generator that yields file chunks and optionally removes the file after streaming."""
-    def _gen():
-        try:
-            with open(path, "rb") as f:
-                while True:
-                    chunk = f.read(8192)
-                    if not chunk:
-                        break
-                    yield chunk
-        finally:
-            if remove_after:
-                try:
-                    os.remove(path)
-                except Exception:
-                    logger.exception("Failed to remove temporary file: %s", path)
-    return _gen()
+@app.get("/readyz")
+async def readyz():
+    """
+    Readiness probe for load balancers.
+    Returns 200 only once the CLIPS session is warm, so traffic isn't routed
+    to an instance that would pay the session-create round-trip in a request.
+    """
+    if _cerebrum_session is None:
+        return ORJSONResponse({"status": "warming"}, status_code=503)
+    return {"status": "ready"}
 
-@app.post("/clara/api/v1/speak")
-async def speak(payload: SpeakRequest, auth: HTTPAuthorizationCredentials = Depends(bearer_scheme)):
+@app.post("/clara/api/v1/speak", dependencies=[Depends(require_bearer)])
+async def speak(payload: SpeakRequest):
     """
     POST /clara/api/v1/speak
     Accept JSON payload { "text": "..." }.
     If `text` is provided, synthesize a WAV via ChatterboxTTS and stream it back.
     Otherwise stream the first .wav found in `./audio` if available, or synthesize a short fallback.
     """
-    # Token verification (in practice, verify the token properly)
-    if auth.credentials != config.bearer_token:
-        raise HTTPException(status_code=403, detail="Invalid or expired token")
-
     logger.info("Received /speak request. text present=%s", bool(payload.text))
     if not payload.text:
         fallback_path = Path("./app/assets/masters_of_the_earth.wav")
         return FileResponse(fallback_path, media_type="audio/wav")
     else:
-        # Generate a GUID for the text (simple hash for caching; use actual hash if needed)
-        text_hash = str(hash(payload.text))
-        cached_file = audio_cache_dir / f"{text_hash}.wav"
+        # Derive a stable GUID for the text so caching works across restarts
+        text_hash = _text_hash(payload.text)
+        cached_file = _cache_path(text_hash)
 
-        if not cached_file.exists():
-            try:
-                ChatterboxTTS.synthesize_to_wav(payload.text, str(cached_file))
-            except Exception as e:
-                logger.error("TTS synthesis failed: %s. Falling back to masters_of_the_earth.wav", e)
-                # Fall back to masters_of_the_earth.wav
-                fallback_file = Path("./app/assets/masters_of_the_earth.wav")
-                if fallback_file.exists():
-                    logger.info("Using fallback audio: masters_of_the_earth.wav")
-                    return FileResponse(fallback_file, media_type="audio/wav")
-                else:
-                    logger.error("Fallback file not found: %s", fallback_file)
-                    raise HTTPException(status_code=500, detail="TTS synthesis failed and fallback audio not available")
+        cache_hit = text_hash in _audio_cache or cached_file.exists()
+        if cache_hit:
+            _remember_audio(text_hash, cached_file)
+        else:
+            fut = _inflight.get(text_hash)
+            if fut is not None:
+                # Another request is already synthesizing this text; wait for
+                # its result instead of spawning a duplicate synthesis.
+                if not await asyncio.shield(fut):
+                    return _tts_fallback_response()
+            else:
+                # First request for this text: synthesize in a thread so the
+                # event loop keeps serving /health, WebSocket pings and other
+                # requests, and publish the outcome for coalesced waiters.
+                fut = asyncio.get_running_loop().create_future()
+                _inflight[text_hash] = fut
+                synthesized = True
+                try:
+                    try:
+                        # Synthesize to a temp path and os.replace() into place
+                        # so /audio readers never observe a half-written WAV.
+                        cached_file.parent.mkdir(parents=True, exist_ok=True)
+                        tmp_file = cached_file.with_name(f".{text_hash}.wav.tmp")
+                        await asyncio.to_thread(
+                            ChatterboxTTS.synthesize_to_wav, payload.text, str(tmp_file)
+                        )
+                        os.replace(tmp_file, cached_file)
+                        _remember_audio(text_hash, cached_file)
+                    except Exception as e:
+                        logger.error("TTS synthesis failed: %s. Falling back to masters_of_the_earth.wav", e)
+                        synthesized = False
+                finally:
+                    fut.set_result(synthesized)
+                    _inflight.pop(text_hash, None)
+                if not synthesized:
+                    return _tts_fallback_response()
 
         # Broadcast the new audio GUID to connected WebSocket clients
         # Await the broadcast so tests can receive notifications synchronously
@@ -155,26 +317,52 @@ async def speak(payload: SpeakRequest, auth: HTTPAuthorizationCredentials = Depe
         return FileResponse(cached_file, media_type="audio/wav", headers=headers)
 
 @app.get("/audio/{guid}")
-async def get_audio(guid: str):
-    cached_file = audio_cache_dir / f"{guid}.wav"
-    logger.info(f"Audio request for GUID: {guid}")
-    logger.info(f"Looking for file: {cached_file}")
+async def get_audio(guid: str, request: Request):
+    # Shard only well-formed GUIDs (content hashes are hex): anything else —
+    # notably traversal attempts like "..xy..." — stays on the flat legacy
+    # path, where the guid is a single filename component and can't escape
+    # the cache directory.
+    if len(guid) >= 4 and guid.isalnum():
+        cached_file = _cache_path(guid)
+    else:
+        cached_file = audio_cache_dir / f"{guid}.wav"
+    logger.info("Audio request for GUID: %s", guid)
+    logger.info("Looking for file: %s", cached_file)
 
     if not cached_file.exists():
-        logger.warning(f"Audio file not found: {cached_file}")
-        # List available files for debugging
-        available_files = list(audio_cache_dir.glob("*.wav"))
-        logger.warning(f"Available audio files: {[f.name for f in available_files[:5]]}")
-        raise HTTPException(status_code=404, detail="Audio not found")
+        # Caches written before sharding landed keep working
+        legacy_file = audio_cache_dir / f"{guid}.wav"
+        if legacy_file.exists():
+            cached_file = legacy_file
+        else:
+            logger.warning("Audio file not found: %s", cached_file)
+            raise HTTPException(status_code=404, detail="Audio not found")
+
+    # Cached audio is content-addressed, so the GUID doubles as a strong ETag
+    # and replays from WS-notified clients can revalidate to an empty 304
+    # instead of re-downloading the clip.
+    etag = f'"{guid}"'
+    headers = {"Cache-Control": "public, max-age=3600", "ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
 
     file_size = cached_file.stat().st_size
-    logger.info(f"Serving audio file: {cached_file} ({file_size} bytes)")
-    return FileResponse(cached_file, media_type="audio/wav")
+    logger.info("Serving audio file: %s (%d bytes)", cached_file, file_size)
+    try:
+        mm = _get_hot_audio(guid, cached_file)
+        # Copy inside the guard: the TTL sweep runs in a worker thread and
+        # can close this mapping between lookup and copy, which raises
+        # ValueError on a closed mmap.
+        body = bytes(mm)
+    except (OSError, ValueError):
+        # mmap can fail on empty or just-unlinked files; fall back to streaming
+        return FileResponse(cached_file, media_type="audio/wav", headers=headers)
+    return Response(content=body, media_type="audio/wav", headers=headers)
 
 @app.websocket("/ws/notify")
 async def websocket_notify(websocket: WebSocket):
     await websocket.accept()
-    connected_clients.append(websocket)
+    connected_clients.add(websocket)
     try:
         while True:
             # Keep the connection alive; receive_text will block until client sends something
@@ -182,17 +370,36 @@ async def websocket_notify(websocket: WebSocket):
     except Exception:
         pass
     finally:
-        try:
-            connected_clients.remove(websocket)
-        except ValueError:
-            pass
+        connected_clients.discard(websocket)
+
+# A client that can't take a short notification within this window is
+# backpressured beyond saving; drop it rather than pin the broadcast.
+_BROADCAST_SEND_TIMEOUT = 2.0
+
 
 async def broadcast_message(message: str):
-    for client in connected_clients:
-        try:
-            await client.send_text(message)
-        except Exception:
-            pass
+    """Fan a message out to all connected clients concurrently.
+
+    gather() parallelizes the sends so total wall time is bounded by the
+    slowest client rather than the sum of all clients, and each send is
+    capped at _BROADCAST_SEND_TIMEOUT so a stuck socket is evicted instead
+    of stalling the fan-out.
+    """
+    clients = tuple(connected_clients)
+    if not clients:
+        return
+    results = await asyncio.gather(
+        *(asyncio.wait_for(client.send_text(message), timeout=_BROADCAST_SEND_TIMEOUT)
+          for client in clients),
+        return_exceptions=True,
+    )
+    for client, result in zip(clients, results):
+        if isinstance(result, Exception):
+            connected_clients.discard(client)
+            try:
+                await client.close()
+            except Exception:
+                pass
 
 
 async def _get_cerebrum_session():
@@ -201,24 +408,23 @@ async def _get_cerebrum_session():
 
     try:
         if _cerebrum_client is None:
+            # Normally created in lifespan; fall back for callers outside the app.
             cerebrum_url = os.getenv("CEREBRUM_API_URL", "http://localhost:8080")
             _cerebrum_client = CerebrumClient(base_url=cerebrum_url)
+            await _cerebrum_client.connect()
 
         if _cerebrum_session is None:
             _cerebrum_session = await _cerebrum_client.create_session(user_id="clara-voice")
-            logger.info(f"Created CLIPS session: {_cerebrum_session.session_id}")
+            logger.info("Created CLIPS session: %s", _cerebrum_session.session_id)
 
         return _cerebrum_session
     except Exception as e:
-        logger.error(f"Failed to get CLIPS session: {e}")
+        logger.error("Failed to get CLIPS session: %s", e)
         raise
 
 
-@app.post("/clara/api/v1/prompt", response_model=PromptResponse)
-async def prompt(
-    payload: PromptRequest,
-    auth: HTTPAuthorizationCredentials = Depends(bearer_scheme)
-):
+@app.post("/clara/api/v1/prompt", response_model=PromptResponse, dependencies=[Depends(require_bearer)])
+async def prompt(payload: PromptRequest):
     """
     POST /clara/api/v1/prompt
 
@@ -233,10 +439,7 @@ async def prompt(
         "use_clips": true
     }
     """
-    if auth.credentials != config.bearer_token:
-        raise HTTPException(status_code=403, detail="Invalid or expired token")
-
-    logger.info(f"Received /prompt request: {payload.query}")
+    logger.info("Received /prompt request: %s", payload.query)
 
     try:
         session = await _get_cerebrum_session()
@@ -244,16 +447,27 @@ async def prompt(
         # Build CLIPS script with optional facts and rules
         clips_script_parts = []
 
-        # Add user-provided rules
+        # Add user-provided rules, but only the first time this session sees
+        # them. The key is recorded only after the eval succeeds below — a
+        # failed eval must leave the rules unmarked so a retry re-sends the
+        # defrules instead of silently running without them.
+        new_rules_key = None
         if payload.rules:
-            clips_script_parts.append(payload.rules)
-
-        # Add user-provided facts
+            rules_key = f"{session.session_id}:{_text_hash(payload.rules)}"
+            if rules_key not in _session_rules_seen:
+                clips_script_parts.append(payload.rules)
+                new_rules_key = rules_key
+
+        # Add user-provided facts in a single join so CPython builds one
+        # string via its internal writer instead of an f-string and list
+        # append per fact
         if payload.facts:
-            for fact in payload.facts:
-                if not fact.startswith("("):
-                    fact = f"({fact})"
-                clips_script_parts.append(f"(assert {fact})")
+            clips_script_parts.append(
+                "\n".join(
+                    "(assert " + (fact if fact[:1] == "(" else "(" + fact + ")") + ")"
+                    for fact in payload.facts
+                )
+            )
 
         # Add a query to find relevant information
         # This is a simple approach - assert the query as a fact to trigger rules
@@ -264,12 +478,15 @@ async def prompt(
 
         clips_script = "\n".join(clips_script_parts)
 
-        logger.debug(f"CLIPS script:\n{clips_script}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("CLIPS script:\n%s", clips_script)
 
         clips_result = await session.eval(clips_script)
+        if new_rules_key is not None:
+            _session_rules_seen.add(new_rules_key)
         clips_output = clips_result.get("stdout", "")
 
-        logger.info(f"CLIPS evaluation completed. Output length: {len(clips_output)}")
+        logger.info("CLIPS evaluation completed. Output length: %d", len(clips_output))
 
         # Parse the query context for reasoning explanation
         reasoning = {
@@ -288,53 +505,102 @@ async def prompt(
         else:
             response = "The expert system could not derive a conclusive answer based on the provided facts and rules."
 
-        return PromptResponse(
-            query=payload.query,
-            response=response,
-            reasoning=reasoning,
-            clips_output=clips_output if len(clips_output) < 1000 else clips_output[:1000] + "..."
-        )
+        # Return a Response directly so FastAPI skips the response_model
+        # validation/serialization pass; the payload already matches
+        # PromptResponse (which stays on the route for the OpenAPI schema).
+        return ORJSONResponse({
+            "query": payload.query,
+            "response": response,
+            "reasoning": reasoning,
+            "clips_output": clips_output if len(clips_output) < 1000 else clips_output[:1000] + "..."
+        })
 
     except Exception as e:
-        logger.error(f"Error processing prompt: {e}")
+        logger.error("Error processing prompt: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to process prompt: {str(e)}"
         )
 
 
+def _sweep_expired_audio(ttl: int) -> int:
+    """Delete expired WAVs from the cache directory; returns the delete count.
+
+    Uses os.scandir so each entry's mtime comes from the cached DirEntry stat
+    instead of a second stat syscall per file, and runs synchronously so it can
+    be offloaded to a thread without blocking the event loop.
+    """
+    now = time.time()
+    deleted_count = 0
+
+    def _sweep_dir(path) -> None:
+        nonlocal deleted_count
+        with os.scandir(path) as entries:
+            for entry in entries:
+                # Recurse into the two-level shard directories
+                if entry.is_dir(follow_symlinks=False):
+                    _sweep_dir(entry.path)
+                    continue
+                if not entry.name.endswith(".wav"):
+                    continue
+                try:
+                    # Check file age
+                    file_age = now - entry.stat(follow_symlinks=False).st_mtime
+                    if file_age > ttl:
+                        os.unlink(entry.path)
+                        _audio_cache.pop(entry.name[:-4], None)
+                        _drop_hot_audio(entry.name[:-4])
+                        deleted_count += 1
+                        logger.info("Deleted expired audio file: %s (age: %.0fs)", entry.name, file_age)
+                except Exception as e:
+                    logger.error("Failed to delete %s: %s", entry.path, e)
+
+    _sweep_dir(audio_cache_dir)
+    return deleted_count
+
+
+# Interval between keepalive pings to the CLIPS session
+_CEREBRUM_KEEPALIVE_SECONDS = 60
+
+
+async def _cerebrum_keepalive():
+    """Ping the CLIPS session periodically.
+
+    Keeps connection-pool entries warm and detects a Cerebrum restart before
+    a user request does; a failed ping drops the session so the next /prompt
+    creates a fresh one.
+    """
+    global _cerebrum_session
+    while True:
+        await asyncio.sleep(_CEREBRUM_KEEPALIVE_SECONDS)
+        if _cerebrum_session is None:
+            continue
+        try:
+            await _cerebrum_session.eval('(eval "ok")')
+        except Exception as e:
+            logger.warning("Cerebrum keepalive failed; dropping session: %s", e)
+            _cerebrum_session = None
+
+
 async def cleanup_expired_audio_files():
     """Background task to periodically clean up expired audio files."""
+    # Config is fixed for the process lifetime; hoist the lookups out of the loop
+    interval = config.audio_cache_cleanup_interval_seconds
+    ttl = config.audio_cache_ttl_seconds
     while True:
         try:
-            await asyncio.sleep(config.audio_cache_cleanup_interval_seconds)
+            await asyncio.sleep(interval)
 
-            if config.audio_cache_ttl_seconds <= 0:
+            if ttl <= 0:
                 # TTL disabled
                 continue
 
-            now = time.time()
-            ttl = config.audio_cache_ttl_seconds
-            deleted_count = 0
-
-            for audio_file in audio_cache_dir.glob("*.wav"):
-                try:
-                    # Skip protected files in assets directory
-                    if "assets" in str(audio_file):
-                        continue
-
-                    # Check file age
-                    file_age = now - audio_file.stat().st_mtime
-                    if file_age > ttl:
-                        audio_file.unlink()
-                        deleted_count += 1
-                        logger.info(f"Deleted expired audio file: {audio_file.name} (age: {file_age:.0f}s)")
-                except Exception as e:
-                    logger.error(f"Failed to delete {audio_file}: {e}")
+            # Offload the sweep so thousands of stats don't block the event loop
+            deleted_count = await asyncio.to_thread(_sweep_expired_audio, ttl)
 
             if deleted_count > 0:
-                logger.info(f"Cleaned up {deleted_count} expired audio file(s)")
+                logger.info("Cleaned up %d expired audio file(s)", deleted_count)
 
         except Exception as e:
-            logger.error(f"Error in cleanup task: {e}")
+            logger.error("Error in cleanup task: %s", e)
 
@@ -13,7 +13,11 @@ import soundfile as sf
 from typing import Optional
 import os
 import wave
-import struct
+
+try:
+    import numpy as np
+except ImportError:  # keep the fallback path importable without numpy
+    np = None
 
 logger = logging.getLogger(__name__)
 
@@ -23,16 +27,34 @@ logger = logging.getLogger(__name__)
 FALLBACK_ONLY = os.getenv("CLARA_TTS_FALLBACK_ONLY", "0").lower() in ("1", "true", "yes")
 
 
-def _write_fallback_wav(out_path: str, rate: int = 22050, duration_seconds: float = 1.0):
-    """Write a short mono silent 16-bit PCM WAV to out_path."""
+def _write_fallback_wav(out_path: str, rate: int = 22050, duration_seconds: float = 1.0,
+                        freq: float = 440.0):
+    """Write a short mono 16-bit PCM WAV to out_path.
+
+    With numpy available this is a quiet faded sine cue built from a handful
+    of vectorized ops and written with a single writeframes call; without
+    numpy it degrades to silence.
+    """
     num_samples = int(duration_seconds * rate)
     with wave.open(out_path, 'wb') as wf:
         wf.setnchannels(1)
         wf.setsampwidth(2)  # 16-bit
         wf.setframerate(rate)
-        silence = struct.pack('<h', 0) * num_samples
-        wf.writeframes(silence)
-    logger.info("Wrote fallback silent WAV to %s", out_path)
+        if np is not None and num_samples > 0:
+            t = np.arange(num_samples, dtype=np.float32) / rate
+            tone = 0.2 * np.sin(2 * np.pi * freq * t)
+            env = np.ones(num_samples, dtype=np.float32)
+            fade_samples = min(num_samples // 2, int(0.02 * rate))
+            if fade_samples:
+                env[:fade_samples] = np.linspace(0.0, 1.0, fade_samples, dtype=np.float32)
+                env[-fade_samples:] = np.linspace(1.0, 0.0, fade_samples, dtype=np.float32)
+            samples = (tone * env * 32767.0).astype('<i2')
+            wf.writeframes(samples.tobytes())
+        else:
+            # bytes(n) is a single zero-filled allocation — no intermediate
+            # two-byte pattern to repeat.
+            wf.writeframes(bytes(2 * num_samples))
+    logger.info("Wrote fallback WAV to %s", out_path)
 
 
 class ChatterboxTTS:
@@ -41,6 +63,20 @@ class ChatterboxTTS:
     _instance: Optional['_ChatterboxModel'] = None
     _sample_path: str = "app/assets/clara_sample.wav"  # Path to the voice sample for cloning
 
+    @staticmethod
+    def preload():
+        """Materialize the model eagerly instead of on the first request.
+
+        Called from server startup (behind CLARA_TTS_PRELOAD) so the first
+        /speak doesn't pay the multi-second model load, and so a preloading
+        process manager (gunicorn --preload) shares the CPU weights
+        copy-on-write across forked workers. No-op under FALLBACK_ONLY.
+        """
+        if FALLBACK_ONLY:
+            return
+        if ChatterboxTTS._instance is None:
+            ChatterboxTTS._instance = _ChatterboxModel()
+
     @staticmethod
     def synthesize_to_wav(text: str, out_path: str, rate: int = 22050):
         """
@@ -62,22 +98,43 @@ class ChatterboxTTS:
         try:
             if ChatterboxTTS._instance is None:
                 ChatterboxTTS._instance = _ChatterboxModel()
+            instance = ChatterboxTTS._instance
 
-            # Generate audio using model
-            wav = ChatterboxTTS._instance.model.generate(
-                    text,
-                    audio_prompt_path=ChatterboxTTS._sample_path,
-                    exaggeration=0.0,
-                    cfg_weight=0.8
-                )
+            import torch
+
+            # BF16 autocast halves DRAM traffic for the bandwidth-bound decode
+            # on Ampere+ GPUs; disable with CLARA_TTS_BF16=0 if the vocoder
+            # output sounds degraded. inference_mode covers the tokenization
+            # and conditioning ops that run outside the pipeline's own guard.
+            use_bf16 = (
+                instance.device == "cuda"
+                and os.getenv("CLARA_TTS_BF16", "1") == "1"
+                and torch.cuda.get_device_capability()[0] >= 8
+            )
+            with torch.inference_mode(), torch.autocast(
+                device_type="cuda", dtype=torch.bfloat16, enabled=use_bf16
+            ):
+                # Generate audio using model. The voice conditionals were
+                # encoded once at load time (_prepare_voice), so generate()
+                # reuses them instead of re-encoding the sample WAV per request.
+                wav = instance.model.generate(
+                        text,
+                        exaggeration=0.0,
+                        cfg_weight=0.8
+                    )
 
             # Save to file using soundfile directly
-            # Convert from torch tensor to numpy array and transpose if needed
-            wav_np = wav.cpu().numpy()
+            # Convert from torch tensor to numpy array and transpose if needed.
+            # generate() hands back a host tensor (the vendored pipeline
+            # watermarks on CPU), so skip the device transfer when possible.
+            wav_np = wav.numpy() if wav.device.type == "cpu" else wav.cpu().numpy()
             if wav_np.ndim > 1:
                 wav_np = wav_np.T  # soundfile expects (samples, channels)
-            sf.write(out_path, wav_np, ChatterboxTTS._instance.model.sr)
-            logger.info(f"Synthesized text to {out_path} (sample rate: {ChatterboxTTS._instance.model.sr})")
+            # Write 16-bit PCM instead of float32: half the bytes on disk and
+            # on every subsequent /audio download, at inaudible cost.
+            wav_i16 = (np.clip(wav_np, -1.0, 1.0) * 32767.0).astype(np.int16)
+            sf.write(out_path, wav_i16, instance.model.sr, subtype='PCM_16')
+            logger.info("Synthesized text to %s (sample rate: %s)", out_path, instance.model.sr)
             return out_path
 
         except Exception as e:
@@ -110,6 +167,7 @@ class _ChatterboxModel:
         else:
             device = "cpu"
             logger.info("Using CPU device for TTS")
+        self.device = device
 
         logger.info("Loading ChatterboxTTS model from HuggingFace Hub (this may take a moment)...")
         self.model = _ChatterboxTTS.from_pretrained(device=device)
@@ -121,4 +179,88 @@ class _ChatterboxModel:
         else:
             logger.warning("Model does not have set_attn_implementation method")
 
-        logger.info("ChatterboxTTS model loaded successfully")
\ No newline at end of file
+        # Optional INT8 dynamic quantization on CPU. The Linear layers of the
+        # T3 transformer backbone dominate CPU inference and are memory
+        # bandwidth bound; dynamic qint8 trades negligible quality for a
+        # sizeable speedup and memory cut. The vocoder (s3gen) stays FP32 —
+        # quantizing it is known to hurt audio quality. Disable with
+        # CLARA_QUANTIZE=0.
+        if device == "cpu" and os.getenv("CLARA_QUANTIZE", "1") == "1":
+            try:
+                import platform
+                torch.backends.quantized.engine = (
+                    "fbgemm" if platform.machine() in ("x86_64", "AMD64") else "qnnpack"
+                )
+                self.model.t3 = torch.ao.quantization.quantize_dynamic(
+                    self.model.t3, {torch.nn.Linear}, dtype=torch.qint8
+                )
+                logger.info("Applied INT8 dynamic quantization to the T3 backbone")
+            except Exception as e:
+                logger.warning("INT8 quantization unavailable, keeping FP32: %s", e)
+
+        # Encode the reference voice once at load time. generate() with no
+        # audio_prompt_path reuses model.conds, so requests skip the
+        # reference-encoder pass entirely; the encoded conditionals are also
+        # persisted next to the sample so cold starts skip it too.
+        self._prepare_voice(device)
+
+        # Optional torch.compile of the generation path. Per-token decode on
+        # GPU is kernel-launch bound; "reduce-overhead" mode captures the
+        # decode step into a CUDA graph and replays it. Defaults on for CUDA
+        # only — compile time rarely pays for itself on CPU. Disable with
+        # CLARA_COMPILE=0 (or force on with CLARA_COMPILE=1).
+        compile_default = "1" if device == "cuda" else "0"
+        if os.getenv("CLARA_COMPILE", compile_default) == "1":
+            # The pipeline wrapper is a plain class, not an nn.Module, so
+            # compile the T3 decode backbone that dominates per-token work
+            # (the same module the quantization path targets).
+            compiled = False
+            try:
+                self.model.t3 = torch.compile(
+                    self.model.t3, mode="reduce-overhead", dynamic=False, fullgraph=False
+                )
+                compiled = True
+                logger.info("Compiled T3 backbone with torch.compile (reduce-overhead)")
+            except Exception as e:
+                logger.warning("torch.compile unavailable, staying eager: %s", e)
+            if compiled:
+                # Pay the graph-capture cost now rather than on the first
+                # real /speak request.
+                try:
+                    self.model.generate("warmup", exaggeration=0.0, cfg_weight=0.8)
+                    logger.info("Warmed up compiled TTS model")
+                except Exception as e:
+                    logger.warning("TTS warmup generation failed: %s", e)
+
+        logger.info("ChatterboxTTS model loaded successfully")
+
+    def _prepare_voice(self, device: str):
+        """Compute (or load) the cached conditionals for the voice sample.
+
+        The reference encoder is a fixed per-request cost when generate() is
+        handed an audio_prompt_path; encoding clara_sample.wav once and
+        caching the result removes it. The conditionals are torch.save'd
+        beside the sample, invalidated when the sample is newer.
+        """
+        sample_path = ChatterboxTTS._sample_path
+        if not os.path.exists(sample_path):
+            logger.warning("Voice sample %s not found; generate() will need an audio prompt", sample_path)
+            return
+
+        from app.chatterbox.tts import Conditionals
+
+        conds_path = sample_path + ".conds.pt"
+        try:
+            if os.path.exists(conds_path) and os.path.getmtime(conds_path) >= os.path.getmtime(sample_path):
+                self.model.conds = Conditionals.load(conds_path, map_location="cpu").to(device)
+                logger.info("Loaded cached voice conditionals from %s", conds_path)
+                return
+        except Exception as e:
+            logger.warning("Failed to load cached conditionals, re-encoding: %s", e)
+
+        self.model.prepare_conditionals(sample_path, exaggeration=0.0)
+        try:
+            self.model.conds.save(conds_path)
+            logger.info("Encoded voice sample and cached conditionals to %s", conds_path)
+        except Exception as e:
+            logger.warning("Could not persist voice conditionals: %s", e)
\ No newline at end of file
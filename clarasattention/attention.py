@@ -1,13 +1,86 @@
 import asyncio
+import functools
+import io
+import aiohttp
 import websockets
-import subprocess
 import argparse
 import os
-import requests
-import tempfile
 import json
 import platform
-import shutil
+import stat
+import tempfile
+
+# Optional in-process playback: writing PCM straight to a persistent output
+# stream skips the per-message player process spawn. Falls back to the
+# subprocess players when sounddevice (PortAudio) isn't available.
+try:
+    import sounddevice as _sd
+    import soundfile as _sf
+except Exception:
+    _sd = None
+    _sf = None
+
+# Per-fetch deadline; built once instead of per request
+_HTTP_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+# Lazily opened persistent output stream, keyed by (samplerate, channels)
+_out_stream = None
+_out_stream_key = None
+
+
+def _play_inprocess(content: bytes) -> bool:
+    """Play WAV bytes through a persistent sounddevice stream.
+
+    Returns False (so callers fall back to a subprocess player) when
+    sounddevice is unavailable or the device rejects the stream.
+    """
+    global _out_stream, _out_stream_key
+    if _sd is None or _sf is None:
+        return False
+    try:
+        data, samplerate = _sf.read(io.BytesIO(content), dtype='int16')
+        channels = data.shape[1] if data.ndim > 1 else 1
+        key = (samplerate, channels)
+        if _out_stream is None or _out_stream_key != key:
+            if _out_stream is not None:
+                _out_stream.close()
+            _out_stream = _sd.RawOutputStream(
+                samplerate=samplerate, channels=channels, dtype='int16'
+            )
+            _out_stream.start()
+            _out_stream_key = key
+        _out_stream.write(data.tobytes())
+        return True
+    except Exception as e:
+        print(f"  ✗ In-process playback failed ({type(e).__name__}: {e}); falling back to player")
+        return False
+
+
+def _scan_path_executables():
+    """Collect every executable name on PATH with one scandir sweep per dir.
+
+    shutil.which walks all of PATH and stats per candidate; precomputing the
+    set turns every later availability check into a set lookup.
+    """
+    names = set()
+    for d in os.environ.get('PATH', '').split(os.pathsep):
+        if not d:
+            continue
+        try:
+            with os.scandir(d) as entries:
+                for entry in entries:
+                    try:
+                        st = entry.stat(follow_symlinks=True)
+                    except OSError:
+                        continue
+                    if stat.S_ISREG(st.st_mode) and st.st_mode & 0o111:
+                        names.add(entry.name)
+        except OSError:
+            continue
+    return names
+
+
+_EXECUTABLES = _scan_path_executables()
 
 
 def _validate_player_cmd(cmd):
@@ -18,7 +91,84 @@ def _validate_player_cmd(cmd):
     # 'cmd' start on Windows is special
     if exe.lower() in ("cmd", "start"):
         return True
-    return shutil.which(exe) is not None
+    return exe in _EXECUTABLES
+
+
+_CLUTCH_CONFIG_PATH = os.path.join(os.path.dirname(__file__), '..', 'clarasvoice', 'claras_clutch.json')
+
+
+# (mtime, player_cmd-or-None) for the last parse of claras_clutch.json
+_CFG_CACHE = None
+
+
+def _player_override():
+    """Return the configured player_cmd from claras_clutch.json, or None.
+
+    Freshness via mtime: one stat per call, with the parse (and validation)
+    redone only when the file actually changes — so edits to the clutch
+    config take effect without restarting the listener.
+    """
+    global _CFG_CACHE
+    try:
+        st = os.stat(_CLUTCH_CONFIG_PATH)
+    except OSError:
+        _CFG_CACHE = None
+        return None
+    if _CFG_CACHE is not None and _CFG_CACHE[0] == st.st_mtime:
+        return _CFG_CACHE[1]
+    pc = None
+    try:
+        with open(_CLUTCH_CONFIG_PATH) as f:
+            cfg = json.load(f)
+        cand = cfg.get('player_cmd')
+        if cand and _validate_player_cmd(cand):
+            pc = cand
+    except Exception:
+        # Corrupted config -> ignore and re-create later
+        pc = None
+    _CFG_CACHE = (st.st_mtime, pc)
+    return pc
+
+# The host OS and per-format candidate tables never change for the life of
+# the process; build them once at import so get_player_cmd is reduced to a
+# dict lookup plus the (memoized) availability filter.
+_SYSTEM = platform.system()
+
+if _SYSTEM == 'Linux':
+    _CANDIDATES_BY_FORMAT = {
+        'mp3': [
+            ['mpg123', '-q'],  # quiet mode
+            ['mpv', '--really-quiet', '--cache=no', '--audio-buffer=0.05'],
+            ['ffplay', '-nodisp', '-autoexit', '-loglevel', 'quiet'],
+            ['play', '-q']  # sox play command
+        ],
+        'ogg': [
+            ['mpv', '--really-quiet', '--cache=no', '--audio-buffer=0.05'],
+            ['ffplay', '-nodisp', '-autoexit', '-loglevel', 'quiet'],
+            ['play', '-q']
+        ],
+        # default to wav/pcm - prefer robust players over aplay
+        'wav': [
+            ['mpv', '--really-quiet', '--cache=no', '--audio-buffer=0.05'],
+            ['ffplay', '-nodisp', '-autoexit', '-loglevel', 'quiet'],
+            ['aplay', '-q', '-M', '--buffer-time=200000', '--period-time=20000'],  # mmap ALSA path, 200ms buffer / 20ms periods
+            ['play', '-q'],
+            ['mpg123', '-q']  # Can play WAV files too
+        ],
+    }
+elif _SYSTEM == 'Darwin':
+    # macOS: afplay handles wav and mp3; prefer more robust players
+    _mac_candidates = [
+        ['afplay'],
+        ['mpv', '--really-quiet', '--cache=no', '--audio-buffer=0.05'],
+        ['ffplay', '-nodisp', '-autoexit', '-loglevel', 'quiet']
+    ]
+    _CANDIDATES_BY_FORMAT = {fmt: _mac_candidates for fmt in ('mp3', 'ogg', 'wav')}
+elif _SYSTEM == 'Windows':
+    _win_candidates = [['cmd', '/c', 'start', '/wait']]
+    _CANDIDATES_BY_FORMAT = {fmt: _win_candidates for fmt in ('mp3', 'ogg', 'wav')}
+else:
+    _CANDIDATES_BY_FORMAT = {}
 
 
 def get_player_cmd(audio_format: str | None = None):
@@ -27,54 +177,16 @@ def get_player_cmd(audio_format: str | None = None):
     If a saved `claras_clutch.json` contains a valid `player_cmd`, use that.
     Otherwise return multiple candidates to try in order (with fallbacks).
     """
-    config_path = os.path.join(os.path.dirname(__file__), '..', 'clarasvoice', 'claras_clutch.json')
-    # Try to load an existing config; tolerate JSON errors and missing keys
-    try:
-        if os.path.exists(config_path):
-            with open(config_path) as f:
-                cfg = json.load(f)
-            pc = cfg.get('player_cmd')
-            if pc and _validate_player_cmd(pc):
-                return [pc]  # Return as list for consistency
-    except Exception:
-        # Corrupted config -> ignore and re-create later
-        pass
+    pc = _player_override()
+    if pc:
+        return [pc]  # Return as list for consistency
+    return _player_candidates(audio_format or 'wav')
+
 
-    system = platform.system()
-    candidates = []
-
-    # Build priority list of players with optimized flags
-    if system == 'Linux':
-        if audio_format == 'mp3':
-            candidates = [
-                ['mpg123', '-q'],  # quiet mode
-                ['mpv', '--really-quiet'],
-                ['ffplay', '-nodisp', '-autoexit', '-loglevel', 'quiet'],
-                ['play', '-q']  # sox play command
-            ]
-        elif audio_format == 'ogg':
-            candidates = [
-                ['mpv', '--really-quiet'],
-                ['ffplay', '-nodisp', '-autoexit', '-loglevel', 'quiet'],
-                ['play', '-q']
-            ]
-        else:  # default to wav/pcm - prefer robust players over aplay
-            candidates = [
-                ['mpv', '--really-quiet'],
-                ['ffplay', '-nodisp', '-autoexit', '-loglevel', 'quiet'],
-                ['aplay', '--buffer-size=8192'],  # Large buffer to prevent underruns
-                ['play', '-q'],
-                ['mpg123', '-q']  # Can play WAV files too
-            ]
-    elif system == 'Darwin':
-        # macOS: afplay handles wav and mp3; prefer more robust players
-        candidates = [
-            ['afplay'],
-            ['mpv', '--really-quiet'],
-            ['ffplay', '-nodisp', '-autoexit', '-loglevel', 'quiet']
-        ]
-    elif system == 'Windows':
-        candidates = [['cmd', '/c', 'start', '/wait']]
+@functools.lru_cache(maxsize=8)
+def _player_candidates(audio_format):
+    """Availability-filtered candidates, memoized per format."""
+    candidates = _CANDIDATES_BY_FORMAT.get(audio_format) or _CANDIDATES_BY_FORMAT.get('wav', [])
 
     # Filter to only available players
     available = []
@@ -83,120 +195,448 @@ def get_player_cmd(audio_format: str | None = None):
             available.append(cmd)
 
     if not available:
-        raise RuntimeError(f"No suitable audio player found for OS: {system}. Try installing 'mpv', 'ffplay', 'aplay' (alsa-utils), 'mpg123', or 'sox'.")
+        raise RuntimeError(f"No suitable audio player found for OS: {_SYSTEM}. Try installing 'mpv', 'ffplay', 'aplay' (alsa-utils), 'mpg123', or 'sox'.")
 
     return available
 
 
-async def listen_and_play(host: str, port: int):
-    uri = f"ws://{host}:{port}/ws/notify"
+def _stdin_player_cmd(player_cmd, audio_format):
+    """Return a stdin-reading variant of player_cmd, or None if unsupported."""
+    exe = player_cmd[0]
+    if exe == 'mpv':
+        return player_cmd + ['-']
+    if exe == 'ffplay':
+        return player_cmd + ['-i', '-']
+    if exe == 'mpg123':
+        return player_cmd + ['-']
+    if exe == 'play':
+        return player_cmd + ['-t', audio_format or 'wav', '-']
+    if exe == 'aplay':
+        return list(player_cmd)  # aplay reads stdin when given no file
+    return None  # afplay / Windows start can't read a pipe
+
+
+# Coalesce downloaded chunks into pipe writes of this size. One write per
+# 8 KiB aiohttp chunk is a syscall (and a player wake-up) per chunk; batching
+# to 256 KiB cuts both by ~32x. The very first chunk is flushed immediately
+# so playback still starts on arrival rather than behind a full buffer.
+_PIPE_WRITE_SIZE = 256 * 1024
+
 
-    async with websockets.connect(uri) as websocket:
-        print("Connected to server for notifications.")
-        async for guid in websocket:
-            print(f"Received GUID: {guid}")
-            # Fetch audio stream
-            api_url = f"http://{host}:{port}/audio/{guid}"
-            print(f"  → Fetching from: {api_url}")
+async def _pipe_to_player(cmd, chunks, proc=None):
+    """Spawn cmd (unless given a pre-spawned proc) and feed chunks to its
+    stdin; returns the exit code.
+
+    Streaming into the player's pipe means playback starts on the first
+    chunk instead of after a full download-to-tempfile round trip.
+    """
+    if proc is None:
+        # close_fds=False: our long-lived fds (sockets, event loop plumbing)
+        # are cloexec already, so skip the per-spawn close-every-fd walk.
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdin=asyncio.subprocess.PIPE, close_fds=False
+        )
+    try:
+        out = bytearray()
+        primed = False
+
+        async def _flush():
+            if out:
+                proc.stdin.write(bytes(out))
+                await proc.stdin.drain()
+                out.clear()
+
+        async def _feed(chunk):
+            nonlocal primed
+            if not chunk:
+                return
+            out.extend(chunk)
+            if not primed or len(out) >= _PIPE_WRITE_SIZE:
+                primed = True
+                await _flush()
+
+        if hasattr(chunks, '__aiter__'):
+            async for chunk in chunks:
+                await _feed(chunk)
+        else:
+            for chunk in chunks:
+                await _feed(chunk)
+        await _flush()
+        proc.stdin.close()
+    except (BrokenPipeError, ConnectionResetError):
+        # Player exited early; its return code tells us whether that was
+        # a clean finish or a failure.
+        pass
+    try:
+        return await asyncio.wait_for(proc.wait(), timeout=30)
+    except asyncio.TimeoutError:
+        proc.kill()
+        raise
+
+
+async def _prespawn_wav_player():
+    """Spawn the preferred WAV stdin player before the response arrives.
+
+    Overlaps the player's fork/exec (tens of ms) with the first HTTP RTT.
+    Returns (cmd, proc), or None when no stdin-capable player exists.
+    """
+    try:
+        for player_cmd in get_player_cmd('wav'):
+            cmd = _stdin_player_cmd(player_cmd, 'wav')
+            if cmd:
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd, stdin=asyncio.subprocess.PIPE, close_fds=False
+                )
+                return cmd, proc
+    except Exception:
+        pass
+    return None
+
+
+def _discard_prespawn(prespawn):
+    """Kill a pre-spawned player that ended up unused."""
+    if prespawn is None:
+        return
+    _, proc = prespawn
+    try:
+        proc.stdin.close()
+        proc.kill()
+    except ProcessLookupError:
+        pass
+
+
+class _MpvController:
+    """One resident ``mpv --idle`` process fed over its JSON IPC socket.
+
+    Spawning a player per clip pays fork/exec plus codec and audio-device
+    init (easily 100 ms+) every notification; a persistent decoder turns
+    that into a few bytes of IPC. Created lazily on first use and torn
+    down on any IPC trouble, so callers always have the per-clip spawn
+    path to fall back on.
+    """
+
+    _instance = None
+
+    def __init__(self, proc, reader, writer, socket_path):
+        self._proc = proc
+        self._reader = reader
+        self._writer = writer
+        self._socket_path = socket_path
+
+    @classmethod
+    def started(cls):
+        return cls._instance is not None
+
+    @classmethod
+    async def get(cls):
+        """Return the shared controller, starting mpv if needed; None if
+        mpv (or the platform's /proc fd plumbing) isn't available."""
+        if cls._instance is not None:
+            return cls._instance
+        if _SYSTEM != 'Linux' or 'mpv' not in _EXECUTABLES:
+            return None
+        socket_path = os.path.join(
+            tempfile.gettempdir(), f"clarabells-mpv-{os.getpid()}.sock"
+        )
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                'mpv', '--idle=yes', '--no-terminal', '--really-quiet',
+                '--cache=no', '--audio-buffer=0.05',
+                f'--input-ipc-server={socket_path}',
+                stdin=asyncio.subprocess.DEVNULL, close_fds=False,
+            )
+            # The IPC socket appears shortly after mpv starts; poll briefly.
+            for _ in range(40):
+                try:
+                    reader, writer = await asyncio.open_unix_connection(socket_path)
+                    break
+                except (FileNotFoundError, ConnectionRefusedError, OSError):
+                    if proc.returncode is not None:
+                        return None
+                    await asyncio.sleep(0.05)
+            else:
+                proc.kill()
+                return None
+        except Exception:
+            return None
+        cls._instance = cls(proc, reader, writer, socket_path)
+        return cls._instance
+
+    @classmethod
+    def teardown(cls):
+        """Kill the resident player; the next clip will respawn or fall back."""
+        inst = cls._instance
+        cls._instance = None
+        if inst is None:
+            return
+        try:
+            inst._writer.close()
+        except Exception:
+            pass
+        try:
+            inst._proc.kill()
+        except ProcessLookupError:
+            pass
+
+    async def play(self, content: bytes) -> bool:
+        """Queue one clip and wait for it to finish; True on clean EOF."""
+        # The body goes into an anonymous O_TMPFILE that mpv opens through
+        # our /proc fd entry — no directory entry, no unlink, reclaimed on
+        # close. loadfile needs the full file, so content is pre-read.
+        fd = os.open(tempfile.gettempdir(), os.O_TMPFILE | os.O_RDWR, 0o600)
+        try:
+            os.write(fd, content)
+            path = f"/proc/{os.getpid()}/fd/{fd}"
+            cmd = json.dumps({"command": ["loadfile", path, "append-play"]})
+            self._writer.write(cmd.encode() + b"\n")
+            await self._writer.drain()
+            # Playback is serialized by _play_lock, so the next end-file
+            # event on the socket belongs to this clip.
+            while True:
+                line = await asyncio.wait_for(self._reader.readline(), timeout=60)
+                if not line:
+                    raise ConnectionError("mpv IPC connection closed")
+                try:
+                    msg = json.loads(line)
+                except ValueError:
+                    continue
+                if msg.get("event") == "end-file":
+                    return msg.get("reason") in (None, "eof")
+        finally:
+            os.close(fd)
+
+
+async def _play_via_mpv_daemon(content: bytes) -> bool:
+    """Play through the resident mpv, tearing it down on any failure."""
+    ctl = await _MpvController.get()
+    if ctl is None:
+        return False
+    try:
+        return await ctl.play(content)
+    except Exception as e:
+        print(f"  ✗ Persistent mpv failed ({type(e).__name__}: {e}); falling back")
+        _MpvController.teardown()
+        return False
+
+
+async def _fetch_and_play(session: aiohttp.ClientSession, api_url: str, guid: str):
+    """Fetch one clip and play it, preferring in-process then stdin players."""
+    # Issue the GET and the player fork/exec concurrently so the spawn cost
+    # hides behind the first RTT. Skipped when sounddevice handles WAV
+    # in-process — a pre-spawned player would usually be thrown away.
+    resp_task = asyncio.create_task(session.get(api_url, timeout=_HTTP_TIMEOUT))
+    prespawn = (
+        None if (_sd is not None or _MpvController.started())
+        else await _prespawn_wav_player()
+    )
+    try:
+        response = await resp_task
+    except BaseException:
+        _discard_prespawn(prespawn)
+        raise
+    await _play_response(response, guid, prespawn)
+
+
+async def _play_response(response, guid, prespawn):
+    """Play one fetched clip; takes ownership of any pre-spawned player."""
+    try:
+        async with response:
+            response.raise_for_status()
+            print(f"  ✓ HTTP {response.status} received")
+
+            # Try to detect the format from content-type; default to wav
+            ct = response.headers.get('Content-Type', '')
+            content_length = response.headers.get('Content-Length', 'unknown')
+            print(f"  ✓ Content-Type: {ct}, Length: {content_length}")
+
+            if ct.startswith('audio/mpeg') or ct.startswith('audio/mp3'):
+                audio_format = 'mp3'
+            elif ct.startswith('audio/ogg'):
+                audio_format = 'ogg'
+            else:
+                audio_format = 'wav'
+
+            print(f"  ✓ Detected audio format: {audio_format}")
+
+            # Read-ahead: if another worker is mid-playback, spend the wait
+            # downloading the whole body so this clip starts the instant the
+            # audio device frees up, instead of fetching after the wait.
+            content = None
+            if _play_lock.locked():
+                content = await response.read()
+
+            async with _play_lock:
+                await _play_clip(response, audio_format, content, prespawn)
+                prespawn = None
+    finally:
+        _discard_prespawn(prespawn)
+
+
+async def _play_clip(response, audio_format, content, prespawn):
+    """Play one clip (body possibly pre-read); consumes any pre-spawned player."""
+    try:
+        # Prefer in-process playback for WAV: no player process spawn,
+        # no temp file, just PCM into the persistent output stream.
+        if audio_format == 'wav' and _sd is not None:
+            if content is None:
+                content = await response.read()
+            # RawOutputStream.write blocks for roughly the clip duration;
+            # run it in a worker thread so the event loop keeps draining the
+            # websocket and read-ahead fetches. _play_lock (held by our
+            # caller) keeps the stream handle effectively single-threaded.
+            if await asyncio.to_thread(_play_inprocess, content):
+                print("  ✓ Audio played in-process via sounddevice.")
+                return
+
+        # Next preference: the resident mpv decoder — no fork/exec or
+        # codec/device init per clip, just an IPC write.
+        if _SYSTEM == 'Linux' and 'mpv' in _EXECUTABLES:
+            if content is None:
+                content = await response.read()
+            if await _play_via_mpv_daemon(content):
+                print("  ✓ Audio played via persistent mpv.")
+                return
+
+        player_cmds = get_player_cmd(audio_format)
+        print(f"  ✓ Available players: {[cmd[0] for cmd in player_cmds]}")
+
+        # Stream the body straight into the player's stdin — no temp
+        # file, no disk round-trip, and playback overlaps the rest of
+        # the download. The first attempt tees the stream into a buffer
+        # so later candidates can replay the bytes if the player fails
+        # partway through.
+        buffered = bytearray()
+
+        async def _tee_chunks():
+            if content is not None:
+                buffered.extend(content)
+                yield content
+                return
+            async for chunk in response.content.iter_chunked(8192):
+                if chunk:
+                    buffered.extend(chunk)
+                    yield chunk
+
+        played = False
+        stream_used = False
+        last_error = None
+        for i, player_cmd in enumerate(player_cmds, 1):
+            cmd = _stdin_player_cmd(player_cmd, audio_format)
+            if cmd is None:
+                print(f"  → {player_cmd[0]} can't read stdin; skipping")
+                continue
+            print(f"  → Trying player {i}/{len(player_cmds)}: {' '.join(cmd)}")
             try:
-                response = requests.get(api_url, stream=True, timeout=30)
-                response.raise_for_status()
-                print(f"  ✓ HTTP {response.status_code} received")
-
-                # Try to detect extension from content-type; default to .wav
-                ct = response.headers.get('content-type', '')
-                content_length = response.headers.get('content-length', 'unknown')
-                print(f"  ✓ Content-Type: {ct}, Length: {content_length}")
-
-                if ct.startswith('audio/mpeg') or ct.startswith('audio/mp3'):
-                    suffix = '.mp3'
-                    audio_format = 'mp3'
-                elif ct.startswith('audio/ogg'):
-                    suffix = '.ogg'
-                    audio_format = 'ogg'
+                if not stream_used:
+                    stream_used = True
+                    if prespawn is not None and cmd == prespawn[0]:
+                        # Hand the stream to the player spawned during
+                        # the HTTP round-trip.
+                        _, proc = prespawn
+                        prespawn = None
+                        rc = await _pipe_to_player(cmd, _tee_chunks(), proc=proc)
+                    else:
+                        rc = await _pipe_to_player(cmd, _tee_chunks())
                 else:
-                    suffix = '.wav'
-                    audio_format = 'wav'
-
-                player_cmds = get_player_cmd(audio_format)
-                print(f"  ✓ Detected audio format: {audio_format}")
-                print(f"  ✓ Available players: {[cmd[0] for cmd in player_cmds]}")
-
-                # Write to temp file and ensure it's fully written
-                bytes_written = 0
-                with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as temp_file:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            temp_file.write(chunk)
-                            bytes_written += len(chunk)
-                    temp_file_path = temp_file.name
-                    # Explicitly flush before closing context manager
-                    temp_file.flush()
-
-                print(f"  ✓ Wrote {bytes_written} bytes to {temp_file_path}")
-
-                # Verify file exists and has content
-                if not os.path.exists(temp_file_path):
-                    print(f"  ✗ ERROR: Temp file does not exist at {temp_file_path}")
-                else:
-                    file_size = os.path.getsize(temp_file_path)
-                    print(f"  ✓ File exists, size: {file_size} bytes")
-
-                # Try each player in order until one succeeds
-                played = False
-                last_error = None
-                for i, player_cmd in enumerate(player_cmds, 1):
-                    print(f"  → Trying player {i}/{len(player_cmds)}: {player_cmd[0]}")
+                    # Drain whatever the failed attempt didn't pull,
+                    # then replay the full buffered body.
+                    if content is None:
+                        try:
+                            async for chunk in response.content.iter_chunked(8192):
+                                if chunk:
+                                    buffered.extend(chunk)
+                        except Exception:
+                            pass
+                    rc = await _pipe_to_player(cmd, (bytes(buffered),))
+                if rc == 0:
+                    played = True
+                    print(f"  ✓ Audio played successfully with {cmd[0]}.")
+                    break
+                print(f"    ✗ {cmd[0]} exited with code {rc}")
+                last_error = f"exit code {rc}"
+            except asyncio.TimeoutError:
+                print(f"    ✗ Timeout waiting for {cmd[0]}")
+                last_error = "timeout"
+            except FileNotFoundError as e:
+                print(f"    ✗ {cmd[0]} not found in PATH")
+                last_error = e
+            except Exception as e:
+                print(f"    ✗ {cmd[0]} error: {type(e).__name__}: {e}")
+                last_error = e
+
+        if not played:
+            print(f"  ✗ All players failed. Last error: {last_error}")
+    finally:
+        _discard_prespawn(prespawn)
+
+
+# Concurrent playback workers. Two lets the next clip's fetch overlap the
+# current clip's playback without fighting over the audio device much.
+_PLAYBACK_WORKERS = 2
+
+# Serializes actual playback across workers so clips never overlap on the
+# audio device; fetching and read-ahead still run concurrently around it.
+_play_lock = asyncio.Lock()
+
+
+async def listen_and_play(host: str, port: int):
+    uri = f"ws://{host}:{port}/ws/notify"
+
+    # One pooled session for the whole listener: keep-alive connections are
+    # reused across notifications, and streaming reads never block the
+    # websocket coroutine the way synchronous requests did. The connector is
+    # sized for a couple of concurrent playback workers against one server,
+    # with sockets kept warm well past the gap between notifications.
+    connector = aiohttp.TCPConnector(limit=8, limit_per_host=4, keepalive_timeout=60)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        # The only traffic on this socket is short GUID strings, so the
+        # library defaults (1 MiB max_size, 32-deep queue, permessage-deflate)
+        # just cost memory: a tiny cap and shallow queue bound the buffers,
+        # and skipping compression drops the per-connection zlib contexts
+        # nothing this small would ever benefit from.
+        async with websockets.connect(
+            uri,
+            max_size=4096,
+            max_queue=8,
+            compression=None,
+            ping_interval=20,
+            ping_timeout=20,
+        ) as websocket:
+            print("Connected to server for notifications.")
+
+            # Drain the websocket at line rate and let workers fetch/play
+            # concurrently; the small maxsize backpressures the socket when
+            # playback can't keep up instead of queueing unboundedly.
+            queue: asyncio.Queue = asyncio.Queue(maxsize=4)
+
+            async def receiver():
+                async for guid in websocket:
+                    print(f"Received GUID: {guid}")
+                    await queue.put(guid)
+                for _ in range(_PLAYBACK_WORKERS):
+                    await queue.put(None)  # poison pill per worker
+
+            async def worker():
+                while True:
+                    guid = await queue.get()
+                    if guid is None:
+                        return
+                    api_url = f"http://{host}:{port}/audio/{guid}"
+                    print(f"  → Fetching from: {api_url}")
                     try:
-                        # Run without suppressing output to see what's happening
-                        print(f"    Running: {' '.join(player_cmd + [temp_file_path])}")
-                        result = subprocess.run(
-                            player_cmd + [temp_file_path],
-                            check=True,
-                            timeout=30
-                        )
-                        played = True
-                        print(f"  ✓ Audio played successfully with {player_cmd[0]}.")
-                        break
-                    except subprocess.TimeoutExpired:
-                        print(f"    ✗ Timeout waiting for {player_cmd[0]}")
-                        last_error = "timeout"
-                        continue
-                    except subprocess.CalledProcessError as e:
-                        print(f"    ✗ {player_cmd[0]} exited with code {e.returncode}")
-                        last_error = e
-                        continue
-                    except FileNotFoundError as e:
-                        print(f"    ✗ {player_cmd[0]} not found in PATH")
-                        last_error = e
-                        continue
+                        await _fetch_and_play(session, api_url, guid)
+                    except aiohttp.ClientResponseError as e:
+                        print(f"✗ HTTP error fetching audio: {e.status}")
+                        if e.status == 404:
+                            print(f"  Audio file not found for GUID: {guid}")
+                            print(f"  Check if /audio/{guid} exists on server")
+                    except aiohttp.ClientConnectionError as e:
+                        print(f"✗ Failed to connect to server: {e}")
+                        print(f"  Make sure Clara server is running on {host}:{port}")
                     except Exception as e:
-                        print(f"    ✗ {player_cmd[0]} error: {type(e).__name__}: {e}")
-                        last_error = e
-                        continue
+                        print(f"✗ Error: {type(e).__name__}: {e}")
 
-                if not played:
-                    print(f"  ✗ All players failed. Last error: {last_error}")
-                    print(f"  ℹ File is still at: {temp_file_path}")
-                    print(f"  ℹ Try playing manually: <player-cmd> {temp_file_path}")
-                else:
-                    # Clean up temp file only if playback succeeded
-                    try:
-                        os.unlink(temp_file_path)
-                        print(f"  ✓ Cleaned up temp file")
-                    except Exception:
-                        pass
-
-            except requests.exceptions.ConnectionError as e:
-                print(f"✗ Failed to connect to server: {e}")
-                print(f"  Make sure Clara server is running on {host}:{port}")
-            except requests.exceptions.HTTPError as e:
-                print(f"✗ HTTP error fetching audio: {e.response.status_code}")
-                if e.response.status_code == 404:
-                    print(f"  Audio file not found for GUID: {guid}")
-                    print(f"  Check if /audio/{guid} exists on server")
-            except Exception as e:
-                print(f"✗ Error: {type(e).__name__}: {e}")
+            await asyncio.gather(receiver(), *(worker() for _ in range(_PLAYBACK_WORKERS)))
 
 
 def main():
@@ -3,35 +3,82 @@ import tempfile
 import subprocess
 import os
 import argparse
+import functools
 import platform
 import shutil
 
+from requests.adapters import HTTPAdapter
+
+# Hoisted so repeated calls (tests, embedding) don't re-query the platform
+_SYSTEM = platform.system()
+
+# One pooled session per process: top-level requests.post builds a fresh
+# Session (pool, adapters, TLS context) per call, while this one keeps
+# connections alive across repeated/scripted invocations of main().
+_SESSION = requests.Session()
+_SESSION.mount('http://', HTTPAdapter(pool_connections=2, pool_maxsize=8, pool_block=False))
+_SESSION.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=8, pool_block=False))
+
+
+# Normalized content-type -> format; one dict probe replaces the old
+# membership-test chain.
+_CT_MAP = {
+    'audio/mpeg': 'mp3',
+    'audio/mp3': 'mp3',
+    'audio/wav': 'wav',
+    'audio/x-wav': 'wav',
+    'audio/wave': 'wav',
+    'audio/vnd.wave': 'wav',
+    'audio/ogg': 'ogg',
+    'audio/flac': 'flac',
+}
+
+# First four payload bytes as a big-endian word -> format. RIFF needs a
+# 'WAVE' confirmation and raw MPEG frames match on the sync word instead.
+_MAGIC = {
+    0x52494646: 'riff',  # 'RIFF'
+    0x4F676753: 'ogg',   # 'OggS'
+    0x664C6143: 'flac',  # 'fLaC'
+}
+
 
 def detect_format_from_magic(first_bytes, content_type=None):
     if content_type:
-        ct = content_type.split(';', 1)[0].strip().lower()
-        if ct in ('audio/mpeg', 'audio/mp3'):
+        # partition returns a tuple (no list allocation) and stops at the
+        # first ';' — this is the sniff entry point, so every response pays it
+        ct = content_type.partition(';')[0].strip().lower()
+        fmt = _CT_MAP.get(ct)
+        if fmt:
+            return fmt
+    # Fallback to magic bytes: one uint32 dispatch instead of a chain of
+    # startswith scans over the same prefix
+    if len(first_bytes) >= 4:
+        tag = int.from_bytes(first_bytes[:4], 'big')
+        fmt = _MAGIC.get(tag)
+        if fmt == 'riff':
+            # RIFF container: bytes 8-12 carry the form type, 'WAVE' for wav
+            return 'wav' if first_bytes[8:12] == b'WAVE' else None
+        if fmt:
+            return fmt
+        if (tag >> 8) == 0x494433:  # 'ID3' tag header
+            return 'mp3'
+    if len(first_bytes) >= 2:
+        # MPEG frame sync: 11 set bits, one uint16 mask-and-compare
+        word = int.from_bytes(first_bytes[:2], 'big')
+        if (word & 0xFFE0) == 0xFFE0:
             return 'mp3'
-        if ct in ('audio/wav', 'audio/x-wav', 'audio/wave', 'audio/vnd.wave'):
-            return 'wav'
-        if ct == 'audio/ogg':
-            return 'ogg'
-        if ct == 'audio/flac':
-            return 'flac'
-    # Fallback to magic bytes
-    if first_bytes.startswith(b'ID3') or (len(first_bytes) >= 2 and first_bytes[0] == 0xFF and (first_bytes[1] & 0xE0) == 0xE0):
-        return 'mp3'
-    if first_bytes.startswith(b'RIFF') and b'WAVE' in first_bytes[:12]:
-        return 'wav'
-    if first_bytes.startswith(b'OggS'):
-        return 'ogg'
-    if first_bytes.startswith(b'fLaC'):
-        return 'flac'
     return None
 
 
+@functools.lru_cache(maxsize=8)
 def get_player_candidates(system, audio_format):
-    """Return list of player command candidates with optimized settings for reliable playback."""
+    """Return player command candidates with optimized settings for reliable playback.
+
+    Memoized per (system, format): the shutil.which probes behind the
+    availability filter stat their way down PATH, and the installed player
+    set doesn't change within a process. Returns a tuple of tuples so the
+    cached value stays immutable; call sites re-list as needed.
+    """
     candidates = []
 
     if system == 'Linux':
@@ -70,25 +117,85 @@ def get_player_candidates(system, audio_format):
     if not available:
         raise RuntimeError(f"No suitable audio player found for OS: {system}. Try installing 'mpv', 'ffplay', 'aplay' (alsa-utils), 'mpg123', or 'sox'.")
 
-    return available
+    return tuple(tuple(cmd) for cmd in available)
 
 
-def main():
+_players_primed = False
+
+
+def _init_players():
+    """Warm the player-candidate cache for both formats, once per process.
+
+    Runs the PATH probes before the speak request goes out, so the
+    response-to-first-sound path hits only the memoized lookup. Formats
+    with no installed player are simply left to fail at playback time.
+    """
+    global _players_primed
+    if _players_primed:
+        return
+    _players_primed = True
+    for fmt in ('mp3', 'wav'):
+        try:
+            get_player_candidates(_SYSTEM, fmt)
+        except RuntimeError:
+            pass
+
+
+def _stdin_player_cmd(player_cmd, audio_format):
+    """Return a stdin-reading variant of player_cmd, or None if unsupported."""
+    exe = player_cmd[0]
+    if exe in ('mpv', 'mpg123'):
+        return player_cmd + ['-']
+    if exe == 'ffplay':
+        return player_cmd + ['-i', '-']
+    if exe == 'play':
+        return player_cmd + ['-t', audio_format or 'wav', '-']
+    if exe == 'aplay':
+        return list(player_cmd)  # aplay reads stdin when given no file
+    return None  # afplay / Windows start can't read a pipe
+
+
+def _build_parser():
     parser = argparse.ArgumentParser(description="Clarabells client to request and play audio.")
     parser.add_argument("--host", default="127.0.0.1", help="Server host (default: 127.0.0.1)")
     parser.add_argument("--port", type=int, default=8000, help="Server port (default: 8000)")
     parser.add_argument("--text", help="Text to speak (optional)")
     parser.add_argument("--outloud", action="store_true", help="If set, download and play the audio locally")
-    args = parser.parse_args()
+    parser.add_argument("--chunk-size", type=int, default=262144,
+                        help="Download read size in bytes (default: 256 KiB)")
+    return parser
+
+
+# Built once at import: ArgumentParser construction compiles regexes and
+# option tables that repeated main() calls (tests, embedding) needn't redo.
+_PARSER = _build_parser()
+
+
+def main():
+    args = _PARSER.parse_args()
 
     api_url = f"http://{args.host}:{args.port}/clara/api/v1/speak"
     bearer_token = "mysecrettoken"
     headers = {"Authorization": f"Bearer {bearer_token}"}
     payload = {"text": args.text} if args.text else {}
 
+    if not args.outloud:
+        # Notify-only: hint to the server that no body is wanted (the query
+        # param is advisory; Range lets a range-aware server short-circuit
+        # body generation to a single byte). We only ever read the headers,
+        # and Connection: close tells urllib3 up front the socket won't be
+        # pooled, so it never drains body bytes for reuse.
+        api_url += "?notify_only=1"
+        headers["Range"] = "bytes=0-63"
+        headers["Connection"] = "close"
+    else:
+        # Probe for installed players before the request leaves, so the
+        # stretch between response headers and first sound stays probe-free.
+        _init_players()
+
     try:
         # Use stream=True so we can inspect headers/magic bytes without necessarily downloading the body
-        resp = requests.post(api_url, headers=headers, json=payload, stream=True, timeout=30)
+        resp = _SESSION.post(api_url, headers=headers, json=payload, stream=True, timeout=30)
         resp.raise_for_status()
 
         # If the user didn't ask to play out loud, just verify we received a GUID header and close
@@ -99,63 +206,185 @@ def main():
                 print(f"OK: server synthesized audio GUID={guid}")
             else:
                 # No GUID header: server likely returned a raw audio file (e.g., fallback or existing file).
-                # We can detect the content-type to confirm it's audio and avoid downloading.
-                if content_type.startswith('audio/'):
+                # Sniff at most 64 bytes for the magic check — the Range
+                # header above caps what the server sends anyway — so
+                # verification names the format without a download.
+                sniff = b''
+                try:
+                    sniff = resp.raw.read(64)
+                except Exception:
+                    pass
+                audio_format = detect_format_from_magic(sniff, content_type)
+                if audio_format:
+                    print(f"OK: server returned {audio_format} audio (Content-Type: {content_type}) but no GUID header")
+                elif content_type.startswith('audio/'):
                     print(f"OK: server returned audio (Content-Type: {content_type}) but no GUID header")
                 else:
                     print(f"OK: server returned status {resp.status_code}")
-            # Close the connection without reading the rest of the body
+            # Drop the socket without draining the body: closing the raw
+            # urllib3 response aborts the stream so no audio bytes cross the
+            # wire, instead of the pool trying to read them for reuse.
+            try:
+                resp.raw.close()
+            except Exception:
+                pass
             try:
                 resp.close()
             except Exception:
                 pass
             return
 
-        # Otherwise, stream and play the audio locally (existing behavior)
-        it = resp.iter_content(chunk_size=8192)
-        first_chunk = next(it, b'')
+        # Otherwise, stream and play the audio locally (existing behavior).
+        # Read from the raw urllib3 response into one reused buffer and write
+        # with os.write: no fresh bytes object per chunk and no Python-level
+        # buffered-writer layer between us and the file. A small sniff read
+        # covers format detection; the rest streams in --chunk-size reads
+        # (256 KiB default), so a multi-MB clip costs dozens of syscalls
+        # instead of hundreds.
+        # Audio bodies aren't content-encoded, so skip urllib3's decode
+        # machinery and read straight off the socket; only enable decoding
+        # if a server surprises us with gzip/deflate.
+        encoding = resp.headers.get('content-encoding', '').lower()
+        resp.raw.decode_content = encoding not in ('', 'identity')
+        first_chunk = resp.raw.read(64)
         content_type = resp.headers.get('content-type')
         audio_format = detect_format_from_magic(first_chunk, content_type)
         if not audio_format:
             audio_format = 'wav'
 
-        suffix = f".{audio_format}"
-        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-            tmp.write(first_chunk)
-            for chunk in it:
-                if chunk:
-                    tmp.write(chunk)
-            temp_file_path = tmp.name
+        player_candidates = [list(cmd) for cmd in get_player_candidates(_SYSTEM, audio_format)]
 
-        system = platform.system()
-        player_candidates = get_player_candidates(system, audio_format)
-
-        # Try each player in order until one succeeds
+        buf = bytearray(max(args.chunk_size, 4096))
+        view = memoryview(buf)
         played = False
         last_error = None
-        for player_cmd in player_candidates:
+
+        # First choice: pipe the body straight into a stdin-capable player.
+        # The kernel pipe replaces the disk round-trip and playback starts
+        # on the first chunk instead of after the full download. Bytes are
+        # teed into `buffered` so the tempfile path below can replay them
+        # if the streaming attempt fails. With Content-Length present the
+        # tee buffer is sized once up front, so tee writes are in-place
+        # slice stores rather than repeated grow-and-copy extends.
+        try:
+            _clen = int(resp.headers.get('content-length') or 0)
+        except (TypeError, ValueError):
+            _clen = 0
+        buffered = bytearray(_clen)
+        boff = 0
+
+        def _tee(piece):
+            nonlocal boff
+            end = boff + len(piece)
+            buffered[boff:end] = piece  # extends automatically past the end
+            boff = end
+
+        _tee(first_chunk)
+        stream_cmd = next(
+            (c for c in (_stdin_player_cmd(pc, audio_format) for pc in player_candidates)
+             if c is not None),
+            None,
+        )
+        if stream_cmd is not None:
             try:
-                # Suppress stderr to avoid "stream is not nice" messages
-                subprocess.run(
-                    player_cmd + [temp_file_path],
-                    check=True,
-                    stderr=subprocess.PIPE,
-                    stdout=subprocess.PIPE
+                proc = subprocess.Popen(
+                    stream_cmd,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    close_fds=False
                 )
-                played = True
-                print(f"Audio played successfully with {player_cmd[0]}.")
-                break
-            except subprocess.CalledProcessError as e:
-                last_error = e
-                continue
+                try:
+                    proc.stdin.write(first_chunk)
+                    while True:
+                        n = resp.raw.readinto(buf)
+                        if not n:
+                            break
+                        _tee(view[:n])
+                        proc.stdin.write(view[:n])
+                    proc.stdin.close()
+                except (BrokenPipeError, OSError):
+                    pass  # player exited early; its return code decides
+                rc = proc.wait()
+                if rc == 0:
+                    played = True
+                    print(f"Audio played successfully with {stream_cmd[0]}.")
+                else:
+                    last_error = RuntimeError(f"{stream_cmd[0]} exited with code {rc}")
             except Exception as e:
                 last_error = e
-                continue
 
         if not played:
-            raise RuntimeError(f"All audio players failed. Last error: {last_error}")
+            # Fallback: finish the download into the tee buffer and replay
+            # it from a temp file for players that need a path (afplay,
+            # Windows `start`) or after a failed streaming attempt.
+            while True:
+                n = resp.raw.readinto(buf)
+                if not n:
+                    break
+                _tee(view[:n])
+
+            # On Linux, O_TMPFILE opens an unlinked file in one syscall: no
+            # name ever hits the directory, no unlink afterwards, and the
+            # kernel reclaims it when the last fd closes. Players read it
+            # through /proc/self/fd/N. Elsewhere, fall back to a named file.
+            temp_file_path = None
+            fd = -1
+            if _SYSTEM == 'Linux' and hasattr(os, 'O_TMPFILE'):
+                try:
+                    fd = os.open(tempfile.gettempdir(), os.O_TMPFILE | os.O_RDWR, 0o600)
+                except OSError:
+                    fd = -1
+            if fd < 0:
+                fd, temp_file_path = tempfile.mkstemp(suffix=f".{audio_format}")
+
+            try:
+                os.write(fd, memoryview(buffered)[:boff])
 
-        os.unlink(temp_file_path)
+                if temp_file_path:
+                    player_path = temp_file_path
+                else:
+                    player_path = f"/proc/self/fd/{fd}"
+                    # Inheritable so the player sees the fd under
+                    # close_fds=False below (Python fds are O_CLOEXEC by
+                    # default, PEP 446).
+                    os.set_inheritable(fd, True)
+
+                # Try each player in order until one succeeds
+                for player_cmd in player_candidates:
+                    try:
+                        # DEVNULL instead of PIPE: player chatter is discarded by the
+                        # kernel rather than buffered in this process for the whole
+                        # playback, and nothing reads those pipes anyway.
+                        # close_fds=False skips the close-every-fd walk before exec
+                        # (everything long-lived is already cloexec) and lets the
+                        # spawn take CPython's posix_spawn fast path.
+                        subprocess.run(
+                            player_cmd + [player_path],
+                            check=True,
+                            stderr=subprocess.DEVNULL,
+                            stdout=subprocess.DEVNULL,
+                            close_fds=False
+                        )
+                        played = True
+                        print(f"Audio played successfully with {player_cmd[0]}.")
+                        break
+                    except subprocess.CalledProcessError as e:
+                        last_error = e
+                        continue
+                    except Exception as e:
+                        last_error = e
+                        continue
+            finally:
+                os.close(fd)
+                if temp_file_path:
+                    try:
+                        os.unlink(temp_file_path)
+                    except OSError:
+                        pass
+
+        if not played:
+            raise RuntimeError(f"All audio players failed. Last error: {last_error}")
 
     except requests.RequestException as e:
         print(f"Request failed: {e}")
@@ -80,7 +80,7 @@ if [ -f "$PID_FILE" ]; then
   fi
 fi
 
-UVICORN_CMD=(python -m uvicorn app.main:app --host "$HOST" --port "$PORT")
+UVICORN_CMD=(python -m uvicorn app.main:app --host "$HOST" --port "$PORT" --loop uvloop --timeout-keep-alive 75)
 
 if [ "$FOREGROUND" -eq 1 ]; then
   echo "Starting server in foreground (host=$HOST port=$PORT)"
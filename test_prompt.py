@@ -1,142 +1,127 @@
 #!/usr/bin/env python3
 """Test script for Clara /prompt endpoint with CLIPS integration."""
 
-import requests
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
-def test_prompt_endpoint():
-    """Test the /prompt endpoint."""
+import requests
 
-    BASE_URL = "http://127.0.0.1:8000"
-    TOKEN = "mysecrettoken"
+BASE_URL = "http://127.0.0.1:8000"
+TOKEN = "mysecrettoken"
 
-    # Test 1: Simple prompt without CLIPS
-    print("=" * 60)
-    print("Test 1: Simple prompt without CLIPS facts/rules")
-    print("=" * 60)
+# One session shared across the worker threads: the urllib3 pool is
+# thread-safe and hands each thread its own keep-alive socket.
+_SESSION = requests.Session()
 
-    payload = {
-        "query": "What is the meaning of life?",
-        "use_clips": False
-    }
 
+def _run_case(label, payload, timeout):
+    """POST one prompt scenario; returns (label, output lines, success)."""
+    lines = []
     headers = {"Authorization": f"Bearer {TOKEN}"}
 
     try:
-        response = requests.post(
-            f"{BASE_URL}/clara/api/v1/prompt",
-            json=payload,
-            headers=headers,
-            timeout=5
-        )
-
-        if response.status_code == 200:
-            result = response.json()
-            print(f"✓ Query: {result['query']}")
-            print(f"✓ Response: {result['response']}")
-            print(f"✓ Reasoning: {json.dumps(result['reasoning'], indent=2)}")
-        else:
-            print(f"✗ Request failed: {response.status_code}")
-            print(f"  Response: {response.text}")
-            return False
-    except Exception as e:
-        print(f"✗ Error: {e}")
-        return False
-
-    # Test 2: Prompt with facts
-    print("\n" + "=" * 60)
-    print("Test 2: Prompt with facts")
-    print("=" * 60)
-
-    payload = {
-        "query": "What color is the sky?",
-        "facts": [
-            "(weather clear)",
-            "(time day)",
-            "(property sky color blue)"
-        ],
-        "use_clips": True
-    }
-
-    try:
-        response = requests.post(
+        response = _SESSION.post(
             f"{BASE_URL}/clara/api/v1/prompt",
             json=payload,
             headers=headers,
-            timeout=30
+            timeout=timeout
         )
-
-        if response.status_code == 200:
-            result = response.json()
-            print(f"✓ Query: {result['query']}")
-            print(f"✓ Response: {result['response']}")
-            if result.get('clips_output'):
-                print(f"✓ CLIPS Output: {result['clips_output'][:200]}")
-            print(f"✓ Reasoning: {json.dumps(result['reasoning'], indent=2)}")
-        else:
-            print(f"✗ Request failed: {response.status_code}")
-            print(f"  Response: {response.text}")
-            return False
     except requests.exceptions.ConnectionError:
-        print("✗ Could not connect to server. Make sure:")
-        print("  1. Clara server is running: python -m uvicorn app.main:app")
-        print("  2. Clara Cerebrum API is running: cargo run --bin clara-api")
-        return False
+        lines.append("✗ Could not connect to server. Make sure:")
+        lines.append("  1. Clara server is running: python -m uvicorn app.main:app")
+        lines.append("  2. Clara Cerebrum API is running: cargo run --bin clara-api")
+        return label, lines, False
     except Exception as e:
-        print(f"✗ Error: {e}")
-        return False
+        lines.append(f"✗ Error: {e}")
+        return label, lines, False
 
-    # Test 3: Prompt with rules
-    print("\n" + "=" * 60)
-    print("Test 3: Prompt with rules")
-    print("=" * 60)
+    if response.status_code != 200:
+        lines.append(f"✗ Request failed: {response.status_code}")
+        lines.append(f"  Response: {response.text}")
+        return label, lines, False
 
-    payload = {
-        "query": "Is the person old?",
-        "facts": [
-            "(person alice)",
-            "(age alice 85)"
-        ],
-        "rules": """
-            (defrule determine-age-status
-                (age ?name ?years)
-                (test (>= ?years 65))
-                =>
-                (printout t ?name " is senior" crlf)
-            )
-        """,
-        "use_clips": True
-    }
+    result = response.json()
+    lines.append(f"✓ Query: {result['query']}")
+    lines.append(f"✓ Response: {result['response']}")
+    if result.get('clips_output'):
+        lines.append(f"✓ CLIPS Output: {result['clips_output'][:200]}")
+    lines.append(f"✓ Reasoning: {json.dumps(result['reasoning'], indent=2)}")
+    return label, lines, True
 
-    try:
-        response = requests.post(
-            f"{BASE_URL}/clara/api/v1/prompt",
-            json=payload,
-            headers=headers,
-            timeout=30
-        )
 
-        if response.status_code == 200:
-            result = response.json()
-            print(f"✓ Query: {result['query']}")
-            print(f"✓ Response: {result['response']}")
-            if result.get('clips_output'):
-                print(f"✓ CLIPS Output:\n{result['clips_output']}")
-            print(f"✓ Reasoning: {json.dumps(result['reasoning'], indent=2)}")
-        else:
-            print(f"✗ Request failed: {response.status_code}")
-            print(f"  Response: {response.text}")
-            return False
-    except Exception as e:
-        print(f"✗ Error: {e}")
+def test_prompt_endpoint():
+    """Test the /prompt endpoint, running the independent scenarios concurrently."""
+
+    cases = [
+        (
+            "Test 1: Simple prompt without CLIPS facts/rules",
+            {
+                "query": "What is the meaning of life?",
+                "use_clips": False
+            },
+            5,
+        ),
+        (
+            "Test 2: Prompt with facts",
+            {
+                "query": "What color is the sky?",
+                "facts": [
+                    "(weather clear)",
+                    "(time day)",
+                    "(property sky color blue)"
+                ],
+                "use_clips": True
+            },
+            30,
+        ),
+        (
+            "Test 3: Prompt with rules",
+            {
+                "query": "Is the person old?",
+                "facts": [
+                    "(person alice)",
+                    "(age alice 85)"
+                ],
+                "rules": """
+                    (defrule determine-age-status
+                        (age ?name ?years)
+                        (test (>= ?years 65))
+                        =>
+                        (printout t ?name " is senior" crlf)
+                    )
+                """,
+                "use_clips": True
+            },
+            30,
+        ),
+    ]
+
+    # The three scenarios hit independent ephemeral sessions, so their CLIPS
+    # evaluation time and network round-trips can overlap; ex.map keeps the
+    # printed output in the original order.
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        results = list(ex.map(lambda case: _run_case(*case), cases))
+
+    success = True
+    for label, lines, ok in results:
+        print("=" * 60)
+        print(label)
+        print("=" * 60)
+        for line in lines:
+            print(line)
+        print()
+        success = success and ok
+
+    if not success:
         return False
 
-    print("\n" + "=" * 60)
+    print("=" * 60)
     print("All tests passed!")
     print("=" * 60)
     return True
 
+
 if __name__ == "__main__":
     success = test_prompt_endpoint()
     sys.exit(0 if success else 1)
@@ -4,3 +4,27 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient (and one lifespan startup) shared across the suite.
+
+    Entering the client runs the app's startup/lifespan events; scoping it
+    to the session pays that cost once instead of per test. The warmup
+    requests pull lazy initialization (TTS pipeline, synthesis path)
+    forward so timing-sensitive tests — notably the websocket notification
+    race in test_attention — measure only the path under test.
+    """
+    with TestClient(app) as c:
+        c.get("/health")
+        c.post(
+            "/clara/api/v1/speak",
+            headers={"Authorization": "Bearer mysecrettoken"},
+            json={"text": "warmup"},
+        )
+        yield c
@@ -29,19 +29,14 @@ def test_config_from_file(tmp_path):
     config_file = tmp_path / "clara_config.json"
     with open(config_file, 'w') as f:
         json.dump(config_data, f)
-    
-    # Change to the temp directory so Config finds the file
-    original_dir = os.getcwd()
-    try:
-        os.chdir(tmp_path)
-        config = Config()
-        
-        assert config.host == "127.0.0.1"
-        assert config.port == 9000
-        assert config.audio_cache_ttl_seconds == 7200
-        assert config.bearer_token == "test-token-123"
-    finally:
-        os.chdir(original_dir)
+
+    # Point Config at the file directly — no process-global chdir
+    config = Config(config_path=str(config_file))
+
+    assert config.host == "127.0.0.1"
+    assert config.port == 9000
+    assert config.audio_cache_ttl_seconds == 7200
+    assert config.bearer_token == "test-token-123"
 
 
 def test_config_env_override():
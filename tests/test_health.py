@@ -1,14 +1,4 @@
-# Add repo root to sys.path so local `app` package is importable during tests
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
-from fastapi.testclient import TestClient
-from app.main import app
-
-
-def test_health():
-    with TestClient(app) as client:
-        r = client.get("/health")
+def test_health(client):
+    r = client.get("/health")
     assert r.status_code == 200
     assert r.json() == {"status": "ok"}